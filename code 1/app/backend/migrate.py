@@ -0,0 +1,110 @@
+"""One-off data migrations, run once per deploy before the API workers start.
+
+    cd backend
+    python migrate.py
+
+Run it while no backend process is serving writes: it recomputes the review
+totals from scratch and overwrites whatever the totals document holds.
+"""
+import asyncio
+import logging
+from datetime import datetime
+
+from pymongo import UpdateOne
+
+from server import (
+    REVIEW_STATS_ID,
+    REVIEW_TOTALS_CACHE_KEY,
+    SORT_INDEXES,
+    AsyncIOMotorClient,
+    AsyncIOMotorDatabase,
+    SortOrder,
+    cache,
+    create_indexes,
+    db_name,
+    mongo_options,
+    mongo_url,
+)
+
+logger = logging.getLogger("migrate")
+
+# Documents rewritten per bulk_write, bounding memory for large collections
+MIGRATION_BATCH_SIZE = 1000
+
+
+async def _convert_string_timestamps(collection, field):
+    """Rewrite ISO-string timestamps written by older versions as BSON dates"""
+    converted = 0
+    updates = []
+    cursor = collection.find({field: {"$type": "string"}}, {field: 1}).batch_size(MIGRATION_BATCH_SIZE)
+    async for doc in cursor:
+        updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": {field: datetime.fromisoformat(doc[field])}}))
+        if len(updates) == MIGRATION_BATCH_SIZE:
+            await collection.bulk_write(updates, ordered=False)
+            converted += len(updates)
+            updates = []
+
+    if updates:
+        await collection.bulk_write(updates, ordered=False)
+        converted += len(updates)
+
+    if converted:
+        logger.info("Converted %d %s.%s values to dates", converted, collection.name, field)
+
+
+async def migrate_timestamps(db: AsyncIOMotorDatabase):
+    """Migrate from ISO-string to native datetime storage"""
+    await asyncio.gather(
+        _convert_string_timestamps(db.reviews, "created_at"),
+        _convert_string_timestamps(db.status_checks, "timestamp"),
+    )
+
+
+async def backfill_review_stats(db: AsyncIOMotorDatabase):
+    """Recompute the running review totals from the reviews collection"""
+    # Only the grouped fields flow into $group, and both live in the rating
+    # sort index, so hinting it lets Mongo answer from the index alone.
+    pipeline = [
+        {"$project": {"_id": 0, "rating": 1, "created_at": 1}},
+        {
+            "$group": {
+                "_id": None,
+                "sum": {"$sum": "$rating"},
+                "count": {"$sum": 1},
+                "last_created_at": {"$max": "$created_at"}
+            }
+        }
+    ]
+
+    result = await db.reviews.aggregate(pipeline, hint=SORT_INDEXES[SortOrder.RATING_DESC]).to_list(1)
+    if result:
+        totals = {key: result[0][key] for key in ("sum", "count", "last_created_at")}
+    else:
+        totals = {"sum": 0, "count": 0, "last_created_at": None}
+
+    await db.stats.update_one(
+        {"_id": REVIEW_STATS_ID},
+        {"$set": totals},
+        upsert=True
+    )
+    logger.info("Backfilled review stats: %s", totals)
+
+
+async def main():
+    client = AsyncIOMotorClient(mongo_url, **mongo_options)
+    db = client[db_name]
+    try:
+        # The backfill needs native dates and hints the rating index
+        await migrate_timestamps(db)
+        await create_indexes(db)
+        await backfill_review_stats(db)
+        # Drop the cached counters so workers reseed from the new totals
+        # instead of serving the old ones until the hash expires
+        await cache.delete(REVIEW_TOTALS_CACHE_KEY)
+    finally:
+        client.close()
+        await cache.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -115,9 +115,11 @@ class RestaurantAPITester:
     def test_get_initial_reviews(self):
         """Test getting initial reviews list"""
         def check_reviews_response(data):
-            if not isinstance(data, list):
-                return False, f"Expected list, got {type(data)}"
-            return True, f"Found {len(data)} reviews"
+            if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+                return False, f"Expected page with items list, got {type(data)}"
+            if "next_cursor" not in data:
+                return False, "Missing field: next_cursor"
+            return True, f"Found {len(data['items'])} reviews"
         
         return self.run_test(
             "Get Initial Reviews",
@@ -176,9 +178,9 @@ class RestaurantAPITester:
         all_passed = True
         for sort_value, sort_name in sort_options:
             def check_sort_response(data):
-                if not isinstance(data, list):
-                    return False, f"Expected list, got {type(data)}"
-                return True, f"Sorted by {sort_name}: {len(data)} reviews"
+                if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+                    return False, f"Expected page with items list, got {type(data)}"
+                return True, f"Sorted by {sort_name}: {len(data['items'])} reviews"
             
             success, _ = self.run_test(
                 f"Sort Reviews - {sort_name}",
@@ -192,6 +194,94 @@ class RestaurantAPITester:
         
         return all_passed
 
+    def test_reviews_pagination(self):
+        """Test following next_cursor across review pages"""
+        def check_page_response(data):
+            if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+                return False, f"Expected page with items list, got {type(data)}"
+            if len(data["items"]) > 2:
+                return False, f"Page exceeds limit: {len(data['items'])} reviews"
+            return True, f"Page of {len(data['items'])} reviews, next_cursor: {data.get('next_cursor')}"
+        
+        success, first_page = self.run_test(
+            "Paginate Reviews - First Page",
+            "GET",
+            "api/reviews?limit=2",
+            200,
+            check_response=check_page_response
+        )
+        if not success or not first_page.get("next_cursor"):
+            return success
+        
+        success, second_page = self.run_test(
+            "Paginate Reviews - Next Page",
+            "GET",
+            f"api/reviews?limit=2&cursor={first_page['next_cursor']}",
+            200,
+            check_response=check_page_response
+        )
+        if not success:
+            return False
+        
+        first_ids = {review["id"] for review in first_page["items"]}
+        overlap = [review["id"] for review in second_page["items"] if review["id"] in first_ids]
+        self.log_test("Paginate Reviews - No Overlap", not overlap, f"Overlapping IDs: {overlap}" if overlap else "")
+        return not overlap
+
+    def test_reviews_ndjson(self):
+        """Test streaming reviews as NDJSON"""
+        url = f"{self.base_url}/api/reviews?limit=2"
+        headers = {'Accept': 'application/x-ndjson'}
+        
+        try:
+            response = requests.get(url, headers=headers, timeout=10)
+            if response.status_code != 200:
+                self.log_test("Stream Reviews - NDJSON", False, f"Status: {response.status_code}")
+                return False
+            
+            lines = [json.loads(line) for line in response.text.splitlines() if line]
+            reviews = [line for line in lines if "next_cursor" not in line]
+            success = (
+                response.headers.get("Content-Type", "").startswith("application/x-ndjson")
+                and len(reviews) <= 2
+                and all("id" in review for review in reviews)
+            )
+            self.log_test("Stream Reviews - NDJSON", success, f"Status: {response.status_code}, {len(reviews)} reviews")
+            return success
+        except Exception as e:
+            self.log_test("Stream Reviews - NDJSON", False, f"Unexpected error: {str(e)}")
+            return False
+
+    def test_etag_revalidation(self, endpoint):
+        """Test that re-sending the returned ETag yields 304 Not Modified"""
+        url = f"{self.base_url}/{endpoint}"
+        name = f"ETag Revalidation - {endpoint}"
+        
+        try:
+            response = requests.get(url, timeout=10)
+            etag = response.headers.get("ETag")
+            if response.status_code != 200 or not etag:
+                self.log_test(name, False, f"Status: {response.status_code}, ETag: {etag}")
+                return False
+            
+            revalidated = requests.get(url, headers={'If-None-Match': etag}, timeout=10)
+            success = revalidated.status_code == 304
+            details = f"ETag: {etag}, Revalidation status: {revalidated.status_code}"
+            
+            if endpoint == "api/reviews":
+                # The NDJSON representation must not validate against the JSON tag
+                other = requests.get(
+                    url, headers={'If-None-Match': etag, 'Accept': 'application/x-ndjson'}, timeout=10
+                )
+                success = success and other.status_code == 200 and other.headers.get("ETag") != etag
+                details += f", NDJSON status: {other.status_code}"
+            
+            self.log_test(name, success, details)
+            return success
+        except Exception as e:
+            self.log_test(name, False, f"Unexpected error: {str(e)}")
+            return False
+
     def test_invalid_review_data(self):
         """Test validation with invalid data"""
         test_cases = [
@@ -257,6 +347,16 @@ def main():
     print("\n🔄 Testing Review Sorting...")
     tester.test_reviews_sorting()
     
+    # Test pagination
+    print("\n📄 Testing Review Pagination...")
+    tester.test_reviews_pagination()
+    tester.test_reviews_ndjson()
+    
+    # Test conditional requests
+    print("\n🏷️ Testing ETag Revalidation...")
+    tester.test_etag_revalidation("api/reviews")
+    tester.test_etag_revalidation("api/reviews/stats")
+    
     # Test validation
     print("\n🛡️ Testing Data Validation...")
     tester.test_invalid_review_data()
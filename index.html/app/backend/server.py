@@ -1,13 +1,23 @@
-from fastapi import FastAPI, APIRouter, Query
+from fastapi import FastAPI, APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError, OperationFailure, WriteConcernError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+import asyncio
+from functools import partial
+from contextlib import asynccontextmanager
+import base64
+import binascii
+import json
+import orjson
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional
-import uuid
+from typing import Annotated, List, Optional
+from uuid_extensions import uuid7
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -15,19 +25,77 @@ from enum import Enum
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# Motor sizes its thread pool from MOTOR_MAX_WORKERS when it is imported, so
+# this has to be set first; its default of 5x the core count mostly adds
+# thread contention here.
+os.environ.setdefault('MOTOR_MAX_WORKERS', str(os.cpu_count() or 1))
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase  # noqa: E402
+
+# MongoDB connection settings; the client itself is opened in lifespan() so it
+# belongs to the event loop that serves requests
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+db_name = os.environ['DB_NAME']
+mongo_options = dict(
+    tz_aware=True,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '50')),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', '10')),
+    waitQueueTimeoutMS=int(os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS', '2000')),
+    serverSelectionTimeoutMS=int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000')),
+)
+
+# Redis connection (review totals cache)
+redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+cache = Redis.from_url(redis_url, decode_responses=True)
+
+REVIEW_TOTALS_CACHE_KEY = "reviews:totals"
+REVIEW_TOTALS_CACHE_TTL = 60  # seconds, bounds drift from the Mongo totals
+
+# Browsers and CDNs may reuse a validated review response for this long
+REVIEWS_CACHE_CONTROL = "public, max-age=30"
+
+# Running totals for reviews (sum, count, last_created_at), kept in sync by create_review
+REVIEW_STATS_ID = "reviews"
+
+# Clients asking for this media type get GET /api/reviews as a line-per-review stream
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Server error code for an unknown command
+COMMAND_NOT_FOUND = 59
 
-# Create the main app without a prefix
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    client = AsyncIOMotorClient(mongo_url, **mongo_options)
+    db = client[db_name]
+    
+    await create_indexes(db)
+    
+    review_batcher = ReviewBatcher(db)
+    review_batcher.start()
+    
+    app.state.db = db
+    app.state.review_batcher = review_batcher
+    try:
+        yield
+    finally:
+        await review_batcher.stop()
+        client.close()
+        await cache.aclose()
+
+
+# Create the main app without a prefix; responses are encoded with orjson
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 
 # Define Models
+_UTC = timezone.utc
+_utc_now = partial(datetime.now, _UTC)
+
+
 class SortOrder(str, Enum):
     DATE_DESC = "date_desc"
     DATE_ASC = "date_asc"
@@ -35,14 +103,35 @@ class SortOrder(str, Enum):
     RATING_ASC = "rating_asc"
 
 
+# id breaks ties between reviews created in the same millisecond
+SORT_OPTIONS = {
+    SortOrder.DATE_DESC: [("created_at", -1), ("id", -1)],
+    SortOrder.DATE_ASC: [("created_at", 1), ("id", 1)],
+    SortOrder.RATING_DESC: [("rating", -1), ("created_at", -1), ("id", -1)],
+    SortOrder.RATING_ASC: [("rating", 1), ("created_at", -1), ("id", -1)],
+}
+
+# Index serving each sort order, passed as a hint; date_asc walks the
+# date_desc index in reverse. rating_asc still sorts created_at descending,
+# so it is not the reverse of rating_desc and needs its own index.
+SORT_INDEXES = {
+    SortOrder.DATE_DESC: SORT_OPTIONS[SortOrder.DATE_DESC],
+    SortOrder.DATE_ASC: SORT_OPTIONS[SortOrder.DATE_DESC],
+    SortOrder.RATING_DESC: SORT_OPTIONS[SortOrder.RATING_DESC],
+    SortOrder.RATING_ASC: SORT_OPTIONS[SortOrder.RATING_ASC],
+}
+
+STATUS_CHECK_SORT = [("timestamp", -1), ("id", -1)]
+
+
 class Review(BaseModel):
     model_config = ConfigDict(extra="ignore")
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: str(uuid7()))
     name: str
     rating: int = Field(ge=1, le=5)
     comment: Optional[str] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utc_now)
 
 
 class ReviewCreate(BaseModel):
@@ -59,15 +148,390 @@ class ReviewStats(BaseModel):
 class StatusCheck(BaseModel):
     model_config = ConfigDict(extra="ignore")
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: str(uuid7()))
     client_name: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utc_now)
 
 
 class StatusCheckCreate(BaseModel):
     client_name: str
 
 
+# Projections matching the response models, so Mongo only ships what we return
+REVIEW_PROJECTION = {"_id": 0, "id": 1, "name": 1, "rating": 1, "comment": 1, "created_at": 1}
+STATUS_CHECK_PROJECTION = {"_id": 0, "id": 1, "client_name": 1, "timestamp": 1}
+
+
+class ReviewPage(BaseModel):
+    items: List[Review]
+    next_cursor: Optional[str] = None
+
+
+class StatusCheckPage(BaseModel):
+    items: List[StatusCheck]
+    next_cursor: Optional[str] = None
+
+
+# Keyset pagination helpers
+def _encode_cursor(doc: dict, sort_keys: List[tuple]) -> str:
+    """Encode the sort-key values of the last returned document as an opaque cursor"""
+    values = {}
+    for field, _ in sort_keys:
+        value = doc[field]
+        values[field] = {"$date": value.isoformat()} if isinstance(value, datetime) else value
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_keys: List[tuple]) -> dict:
+    """Decode a cursor produced by _encode_cursor, rejecting anything malformed"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        last = {}
+        for field, _ in sort_keys:
+            value = values[field]
+            last[field] = datetime.fromisoformat(value["$date"]) if isinstance(value, dict) else value
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return last
+
+
+def _after(sort_keys: List[tuple], last: dict) -> dict:
+    """Filter matching the documents that follow `last` in the given sort order"""
+    # (a, b, c) > (x, y, z)  <=>  a > x  or  (a == x and b > y)  or  ...
+    clauses = []
+    for position, (field, direction) in enumerate(sort_keys):
+        clause = {prefix: last[prefix] for prefix, _ in sort_keys[:position]}
+        clause[field] = {"$lt" if direction < 0 else "$gt": last[field]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+
+def _accepts_ndjson(request: Request) -> bool:
+    """Whether the Accept header lists the NDJSON media type with a non-zero q"""
+    for media_range in request.headers.get("accept", "").split(","):
+        media_type, *params = [part.strip() for part in media_range.split(";")]
+        if media_type.lower() != NDJSON_MEDIA_TYPE:
+            continue
+        
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        return quality > 0
+    return False
+
+
+async def _stream_reviews(cursor, limit: int, sort_keys: List[tuple]):
+    """Yield one JSON line per review, then a {"next_cursor": ...} line if more remain"""
+    sent = 0
+    last = None
+    async for review in cursor:
+        if sent == limit:
+            yield orjson.dumps({"next_cursor": _encode_cursor(last, sort_keys)}) + b"\n"
+            break
+        yield Review.model_construct(**review).model_dump_json().encode() + b"\n"
+        last = review
+        sent += 1
+
+
+# Review totals cache
+# Only bump the cached counters when they are already seeded; a missing hash
+# is rebuilt from the Mongo totals on the next read instead.
+_increment_review_totals = cache.register_script("""
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HINCRBY', KEYS[1], 'sum', ARGV[1])
+    redis.call('HINCRBY', KEYS[1], 'count', ARGV[2])
+    if tonumber(ARGV[3]) > tonumber(redis.call('HGET', KEYS[1], 'last') or 0) then
+        redis.call('HSET', KEYS[1], 'last', ARGV[3])
+    end
+end
+""")
+
+
+def _epoch_ms(value: Optional[datetime]) -> int:
+    return int(value.timestamp() * 1000) if value is not None else 0
+
+
+async def _read_review_totals(db: AsyncIOMotorDatabase):
+    """Return the rating sum, review count and latest created_at (epoch ms) from Mongo"""
+    doc = await db.stats.find_one({"_id": REVIEW_STATS_ID}) or {"sum": 0, "count": 0}
+    return doc["sum"], doc["count"], _epoch_ms(doc.get("last_created_at"))
+
+
+async def _load_review_totals(db: AsyncIOMotorDatabase):
+    """Return the rating sum, review count and latest created_at (epoch ms), from Redis when seeded"""
+    try:
+        total, count, last = await cache.hmget(REVIEW_TOTALS_CACHE_KEY, "sum", "count", "last")
+    except RedisError:
+        logger.warning("Review totals cache unavailable, reading Mongo", exc_info=True)
+        return await _read_review_totals(db)
+    
+    if count is not None:
+        return int(total), int(count), int(last or 0)
+    
+    total, count, last = await _read_review_totals(db)
+    try:
+        async with cache.pipeline() as pipe:
+            pipe.hset(REVIEW_TOTALS_CACHE_KEY, mapping={"sum": total, "count": count, "last": last})
+            pipe.expire(REVIEW_TOTALS_CACHE_KEY, REVIEW_TOTALS_CACHE_TTL)
+            await pipe.execute()
+    except RedisError:
+        logger.warning("Failed to seed cached review totals", exc_info=True)
+    return total, count, last
+
+
+def _reviews_etag(count: int, last: int, variant: str = "") -> str:
+    """Weak validator for anything derived from the review collection
+
+    `variant` tells apart representations of the same URL (see Vary), so a 304
+    never validates a cached body of the other representation.
+    """
+    suffix = f"-{variant}" if variant else ""
+    return f'W/"{count}-{last}{suffix}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+# Review write batching
+class ReviewBatcher:
+    """Coalesces concurrent review inserts into a single insert_many"""
+    
+    def __init__(self, db: AsyncIOMotorDatabase, window: float = 0.005, max_batch: int = 100):
+        self.db = db
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # The batch taken off the queue, and its write once it has started
+        self._batch: list = []
+        self._flushing: Optional[asyncio.Future] = None
+        # Whether the server supports the cross-collection bulkWrite command
+        # (MongoDB 8.0+); None until the first batch finds out.
+        self._bulk_write_command: Optional[bool] = None
+    
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._task is None:
+            return
+        
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        
+        # A batch already being written is allowed to finish, so its callers hear
+        # the real outcome; one still being collected was never written.
+        if self._flushing is not None:
+            await self._flushing
+        
+        pending = self._batch
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._batch = []
+        
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Review batcher stopped"))
+    
+    async def insert(self, doc: dict):
+        """Queue a review for the next batch and wait until it is written"""
+        if self._task is None:
+            errors = await self._write([doc])
+            if errors:
+                raise errors[0]
+            return
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((doc, future))
+        await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._batch = [await self._queue.get()]
+            
+            # A lone insert is written straight away; the coalescing window only
+            # opens when other requests are already queued behind it.
+            if not self._queue.empty():
+                deadline = loop.time() + self.window
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            
+            # Shielded so stop() cancelling this loop cannot abandon a write midway
+            self._flushing = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._flushing)
+            self._batch, self._flushing = [], None
+    
+    async def _flush(self, batch):
+        try:
+            errors = await self._write([doc for doc, _ in batch])
+        except Exception as exc:
+            logger.exception("Failed to write batch of %d reviews", len(batch))
+            errors = {index: exc for index in range(len(batch))}
+        
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in errors:
+                future.set_exception(errors[index])
+            else:
+                future.set_result(None)
+    
+    async def _write(self, docs):
+        """Insert reviews and fold them into the running totals, returning errors by index"""
+        totals = {
+            "$inc": {"sum": sum(doc["rating"] for doc in docs), "count": len(docs)},
+            "$max": {"last_created_at": max(doc["created_at"] for doc in docs)},
+        }
+        
+        errors = None
+        totals_applied = True
+        if self._bulk_write_command is not False:
+            try:
+                errors, totals_applied = await self._write_bulk_command(docs, totals)
+                self._bulk_write_command = True
+            except OperationFailure as exc:
+                if self._bulk_write_command or exc.code != COMMAND_NOT_FOUND:
+                    raise
+                self._bulk_write_command = False
+                logger.info("Server has no bulkWrite command, writing reviews and totals separately")
+        
+        if errors is None:
+            errors, totals_applied = await self._write_separately(docs, totals)
+        
+        # The totals were bumped for the whole batch, so take back the failed
+        # inserts; if the totals update itself failed there is nothing to undo.
+        failed = [doc for index, doc in enumerate(docs) if index in errors]
+        if failed and totals_applied:
+            await self._take_back_totals(failed)
+        
+        # The reviews are stored at this point; Redis is only a cache, so a failure
+        # here must not be reported to the client. The hash TTL and the reseed on
+        # a miss correct the drift. Mirror the Mongo totals, which only moved if
+        # their update succeeded.
+        written = [doc for index, doc in enumerate(docs) if index not in errors]
+        if written and totals_applied:
+            try:
+                await _increment_review_totals(
+                    keys=[REVIEW_TOTALS_CACHE_KEY],
+                    args=[
+                        sum(doc["rating"] for doc in written),
+                        len(written),
+                        _epoch_ms(max(doc["created_at"] for doc in written)),
+                    ]
+                )
+            except RedisError:
+                logger.warning("Failed to update cached review totals", exc_info=True)
+        return errors
+    
+    async def _write_bulk_command(self, docs, totals):
+        """Insert the batch and update the totals in one round-trip
+
+        Returns the insert errors by index, and whether the totals update succeeded.
+        """
+        ops = [{"insert": 0, "document": doc} for doc in docs]
+        ops.append({"update": 1, "filter": {"_id": REVIEW_STATS_ID}, "updateMods": totals, "upsert": True})
+        
+        admin = self.db.client.admin
+        result = await admin.command({
+            "bulkWrite": 1,
+            "ops": ops,
+            "nsInfo": [{"ns": f"{self.db.name}.reviews"}, {"ns": f"{self.db.name}.stats"}],
+            "ordered": False,
+            "errorsOnly": True,
+        })
+        
+        if "writeConcernError" in result:
+            error = result["writeConcernError"]
+            raise WriteConcernError(error.get("errmsg", "bulkWrite write concern error"), error.get("code"), error)
+        
+        # Errors that do not fit in the first batch are left on a server cursor
+        cursor = result["cursor"]
+        reported = list(cursor["firstBatch"])
+        while cursor["id"]:
+            more = await admin.command({"getMore": cursor["id"], "collection": "$cmd.bulkWrite"})
+            cursor = more["cursor"]
+            reported.extend(cursor["nextBatch"])
+        
+        if result.get("nErrors", len(reported)) != len(reported):
+            raise OperationFailure(
+                f"bulkWrite reported {result['nErrors']} errors but returned {len(reported)}"
+            )
+        
+        errors = {}
+        totals_applied = True
+        for error in reported:
+            exc = OperationFailure(error.get("errmsg", "bulkWrite operation failed"), error.get("code"), error)
+            if error["idx"] == len(docs):
+                logger.error("Failed to update review stats: %s", exc)
+                totals_applied = False
+            else:
+                errors[error["idx"]] = exc
+        return errors, totals_applied
+    
+    async def _write_separately(self, docs, totals):
+        """Insert the batch and update the totals as two concurrent requests
+
+        Returns the insert errors by index, and whether the totals update succeeded.
+        """
+        inserted, updated = await asyncio.gather(
+            self.db.reviews.insert_many(docs, ordered=False),
+            self.db.stats.update_one({"_id": REVIEW_STATS_ID}, totals, upsert=True),
+            return_exceptions=True
+        )
+        
+        totals_applied = not isinstance(updated, BaseException)
+        if not totals_applied:
+            logger.error("Failed to update review stats: %s", updated)
+        
+        if isinstance(inserted, BulkWriteError):
+            return {error["index"]: inserted for error in inserted.details["writeErrors"]}, totals_applied
+        if isinstance(inserted, BaseException):
+            # The batch as a whole failed, so undo its share of the totals first
+            if totals_applied:
+                await self._take_back_totals(docs)
+            raise inserted
+        return {}, totals_applied
+    
+    async def _take_back_totals(self, docs):
+        await self.db.stats.update_one(
+            {"_id": REVIEW_STATS_ID},
+            {"$inc": {"sum": -sum(doc["rating"] for doc in docs), "count": -len(docs)}}
+        )
+
+
+# Dependencies
+def get_db(request: Request) -> AsyncIOMotorDatabase:
+    return request.app.state.db
+
+
+def get_review_batcher(request: Request) -> ReviewBatcher:
+    return request.app.state.review_batcher
+
+
+DB = Annotated[AsyncIOMotorDatabase, Depends(get_db)]
+
+
 # Routes
 @api_router.get("/")
 async def root():
@@ -76,7 +540,10 @@ async def root():
 
 # Review routes
 @api_router.post("/reviews", response_model=Review)
-async def create_review(review_input: ReviewCreate):
+async def create_review(
+    review_input: ReviewCreate,
+    review_batcher: Annotated[ReviewBatcher, Depends(get_review_batcher)]
+):
     """Create a new review"""
     review = Review(
         name=review_input.name,
@@ -84,87 +551,142 @@ async def create_review(review_input: ReviewCreate):
         comment=review_input.comment
     )
     
-    doc = review.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
-    
-    await db.reviews.insert_one(doc)
+    await review_batcher.insert(review.model_dump())
     return review
 
 
-@api_router.get("/reviews", response_model=List[Review])
-async def get_reviews(sort: SortOrder = Query(default=SortOrder.DATE_DESC)):
-    """Get all reviews with optional sorting"""
-    sort_options = {
-        SortOrder.DATE_DESC: [("created_at", -1)],
-        SortOrder.DATE_ASC: [("created_at", 1)],
-        SortOrder.RATING_DESC: [("rating", -1), ("created_at", -1)],
-        SortOrder.RATING_ASC: [("rating", 1), ("created_at", -1)],
-    }
+@api_router.get(
+    "/reviews",
+    response_model=ReviewPage,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}}
+)
+async def get_reviews(
+    request: Request,
+    db: DB,
+    sort: SortOrder = Query(default=SortOrder.DATE_DESC),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None)
+):
+    """Get a page of reviews with optional sorting"""
+    ndjson = _accepts_ndjson(request)
+    _, count, last = await _load_review_totals(db)
+    etag = _reviews_etag(count, last, "nd" if ndjson else "")
+    headers = {"ETag": etag, "Cache-Control": REVIEWS_CACHE_CONTROL, "Vary": "Accept"}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    sort_keys = SORT_OPTIONS[sort]
     
-    reviews = await db.reviews.find({}, {"_id": 0}).sort(sort_options[sort]).to_list(1000)
+    query = {}
+    if cursor is not None:
+        query = _after(sort_keys, _decode_cursor(cursor, sort_keys))
     
-    for review in reviews:
-        if isinstance(review.get('created_at'), str):
-            review['created_at'] = datetime.fromisoformat(review['created_at'])
+    reviews_cursor = (
+        db.reviews.find(query, REVIEW_PROJECTION)
+        .sort(sort_keys)
+        .hint(SORT_INDEXES[sort])
+        .limit(limit + 1)
+    )
+    
+    if ndjson:
+        return StreamingResponse(
+            _stream_reviews(reviews_cursor, limit, sort_keys),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers=headers
+        )
+    
+    reviews = await reviews_cursor.to_list(limit + 1)
+    
+    next_cursor = None
+    if len(reviews) > limit:
+        reviews = reviews[:limit]
+        next_cursor = _encode_cursor(reviews[-1], sort_keys)
     
-    return reviews
+    # Documents come from our own collection, so skip re-validating them and
+    # serialize straight to JSON; response_model is kept for the OpenAPI schema.
+    page = ReviewPage.model_construct(
+        items=[Review.model_construct(**review) for review in reviews],
+        next_cursor=next_cursor
+    )
+    return Response(content=page.model_dump_json(), media_type="application/json", headers=headers)
 
 
 @api_router.get("/reviews/stats", response_model=ReviewStats)
-async def get_review_stats():
+async def get_review_stats(request: Request, response: Response, db: DB):
     """Get review statistics (average rating and total count)"""
-    pipeline = [
-        {
-            "$group": {
-                "_id": None,
-                "average_rating": {"$avg": "$rating"},
-                "total_reviews": {"$sum": 1}
-            }
-        }
-    ]
+    total, count, last = await _load_review_totals(db)
     
-    result = await db.reviews.aggregate(pipeline).to_list(1)
+    etag = _reviews_etag(count, last)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": REVIEWS_CACHE_CONTROL})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVIEWS_CACHE_CONTROL
     
-    if result:
-        return ReviewStats(
-            average_rating=round(result[0]["average_rating"], 1),
-            total_reviews=result[0]["total_reviews"]
-        )
+    if count:
+        return ReviewStats(average_rating=round(total / count, 1), total_reviews=count)
     
     return ReviewStats(average_rating=0, total_reviews=0)
 
 
 # Status routes
 @api_router.post("/status", response_model=StatusCheck)
-async def create_status_check(input: StatusCheckCreate):
+async def create_status_check(input: StatusCheckCreate, db: DB):
     status_dict = input.model_dump()
     status_obj = StatusCheck(**status_dict)
     
     doc = status_obj.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
     
     await db.status_checks.insert_one(doc)
     return status_obj
 
 
-@api_router.get("/status", response_model=List[StatusCheck])
-async def get_status_checks():
-    status_checks = await db.status_checks.find({}, {"_id": 0}).to_list(1000)
+@api_router.get("/status", response_model=StatusCheckPage)
+async def get_status_checks(
+    db: DB,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None)
+):
+    query = {}
+    if cursor is not None:
+        query = _after(STATUS_CHECK_SORT, _decode_cursor(cursor, STATUS_CHECK_SORT))
+    
+    status_checks = await (
+        db.status_checks.find(query, STATUS_CHECK_PROJECTION)
+        .sort(STATUS_CHECK_SORT)
+        .hint(STATUS_CHECK_SORT)
+        .limit(limit + 1)
+        .to_list(limit + 1)
+    )
     
-    for check in status_checks:
-        if isinstance(check['timestamp'], str):
-            check['timestamp'] = datetime.fromisoformat(check['timestamp'])
+    next_cursor = None
+    if len(status_checks) > limit:
+        status_checks = status_checks[:limit]
+        next_cursor = _encode_cursor(status_checks[-1], STATUS_CHECK_SORT)
     
-    return status_checks
+    page = StatusCheckPage.model_construct(
+        items=[StatusCheck.model_construct(**check) for check in status_checks],
+        next_cursor=next_cursor
+    )
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 # Include the router in the main app
 app.include_router(api_router)
 
+# CORS_ORIGINS is a comma-separated list; when unset, any subdomain of the
+# site is matched by regex instead of allowing every origin.
+cors_origins = tuple(
+    origin.strip() for origin in os.environ.get('CORS_ORIGINS', '').split(',') if origin.strip()
+)
+cors_origin_regex = None
+if not cors_origins:
+    cors_origin_regex = os.environ.get('CORS_ORIGIN_REGEX', r"https://([a-z0-9-]+\.)*lacongolaise\.fr")
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_origins=cors_origins,
+    allow_origin_regex=cors_origin_regex,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -177,6 +699,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+async def create_indexes(db: AsyncIOMotorDatabase):
+    """Create the indexes backing the review and status check sort orders"""
+    review_indexes = dict.fromkeys(tuple(keys) for keys in SORT_INDEXES.values())
+    await asyncio.gather(
+        *(db.reviews.create_index(list(keys)) for keys in review_indexes),
+        db.status_checks.create_index(STATUS_CHECK_SORT),
+    )
+
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # Development entry point; "auto" picks uvloop and httptools when they are
+    # installed (uvloop is skipped on Windows), production pins them with one
+    # worker per core (see README)
+    uvicorn.run(
+        "server:app",
+        host=os.environ.get('HOST', '0.0.0.0'),
+        port=int(os.environ.get('PORT', '8001')),
+        loop="auto",
+        http="auto",
+    )